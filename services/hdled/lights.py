@@ -1,79 +1,298 @@
-import RPi.GPIO as GPIO
+import lgpio
 import time
-import psutil
 import os
+import errno
+import re
+import ctypes
+import select
+import signal
+import threading
+from collections import deque
 
 # --- LED Setup ---
 LED_PINS = [20, 21, 13, 26]
-GPIO.setmode(GPIO.BCM)
-GPIO.setup(LED_PINS, GPIO.OUT)
+GPIO_CHIPS = (4, 0)  # RP1 is gpiochip4 on early Pi 5 kernels, gpiochip0 later
+LED_MASK = (1 << len(LED_PINS)) - 1  # group bit i drives LED_PINS[i]
+PIN_MASKS = [1 << i for i in range(len(LED_PINS))]
+
+def open_leds():
+    """Claim LED_PINS as a single output group on the first usable gpiochip."""
+    for chip in GPIO_CHIPS:
+        try:
+            handle = lgpio.gpiochip_open(chip)
+        except lgpio.error:
+            continue
+        lgpio.group_claim_output(handle, LED_PINS)
+        return handle
+    raise RuntimeError("No usable gpiochip for the LEDs.")
+
+_chip = None  # lgpio handle, opened by main()
+_led_state = 0  # shadow of the group's output levels; claimed low
+
+def write_leds(mask):
+    """Set every LED at once: those in mask high, the rest low."""
+    global _led_state
+    if mask == _led_state:
+        return
+    lgpio.group_write(_chip, LED_PINS[0], mask, LED_MASK)
+    _led_state = mask
+
+def release_leds():
+    lgpio.group_free(_chip, LED_PINS[0])
+    lgpio.gpiochip_close(_chip)
 
 BLINK_DELAY = 0.15  # Light pattern speed
-IDLE_DELAY = 0.5    # Delay during idle pulse
 ACTIVITY_THRESHOLD = 1024 * 10  # bytes/sec threshold to trigger show
+EWMA_ALPHA = 0.2         # Weight of the newest sample in the smoothed rate
+POLL_INTERVAL = 0.5      # Poll rate while the disk is busy
+MAX_POLL_INTERVAL = 5.0  # Idle polls back off up to this interval
+NAS_MOUNT = "/srv/nas"
+
+# --- Signal wakeups ---
+# Signals hit a self-pipe so idle waits end at once; SIGTERM cleans up too
+_sig_r = None
+
+def _on_sigterm(signum, frame):
+    raise KeyboardInterrupt
+
+def install_signal_wakeup():
+    global _sig_r
+    _sig_r, sig_w = os.pipe()
+    os.set_blocking(sig_w, False)
+    signal.set_wakeup_fd(sig_w)
+    signal.signal(signal.SIGTERM, _on_sigterm)
+
+# --- Filesystem activity wakeups ---
+# While idle, file activity in the share cuts the backoff short
+IN_ACCESS = 0x001
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_CREATE = 0x100
+FS_EVENTS = IN_ACCESS | IN_MODIFY | IN_CLOSE_WRITE | IN_CREATE
+INOTIFY_MAX_WATCHES = 1024  # directories watched, nearest the root first
+_libc = ctypes.CDLL(None, use_errno=True)
+
+def open_fs_watch(root):
+    """Return an inotify fd watching root and its subdirectories, or None."""
+    fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        return None
+    watched = 0
+    pending = deque([root])
+    while pending and watched < INOTIFY_MAX_WATCHES:
+        path = pending.popleft()
+        if _libc.inotify_add_watch(fd, os.fsencode(path), FS_EVENTS) < 0:
+            if ctypes.get_errno() == errno.ENOSPC:
+                break  # out of watches; keep the ones we have
+            continue  # gone or unreadable; the rest of the tree still counts
+        watched += 1
+        try:
+            with os.scandir(path) as it:
+                pending.extend(e.path for e in it if e.is_dir(follow_symlinks=False))
+        except OSError:
+            continue
+    if not watched:
+        os.close(fd)
+        return None
+    drain_events(fd)  # scanning the tree queued events of its own
+    return fd
+
+def drain_events(fd):
+    """Discard everything queued on a non-blocking inotify fd."""
+    try:
+        while os.read(fd, 4096):
+            pass
+    except BlockingIOError:
+        pass
+
+def wait(timeout, fs_fd=None):
+    """Sleep up to timeout seconds; return True if woken by fs_fd activity."""
+    fds = [_sig_r] if fs_fd is None else [_sig_r, fs_fd]
+    ready, _, _ = select.select(fds, [], [], timeout)
+    if _sig_r in ready:
+        os.read(_sig_r, 512)
+    if fs_fd in ready:
+        drain_events(fs_fd)
+        return True
+    return False
+
+# --- LED animation thread ---
+SPIN_PATTERN = PIN_MASKS * 2   # two rotations, one LED lit per step
+spin_event = threading.Event()  # set by the poll loop when the disk is busy
+led_stop = threading.Event()
 
 def all_off():
-    for p in LED_PINS:
-        GPIO.output(p, GPIO.LOW)
+    write_leds(0)
 
-def circular_spin(repeats=1):
-    for _ in range(repeats):
-        for p in LED_PINS:
-            GPIO.output(p, GPIO.HIGH)
-            time.sleep(BLINK_DELAY)
-            GPIO.output(p, GPIO.LOW)
+def play_pattern(pattern, step=BLINK_DELAY):
+    """Play a precomputed list of LED masks, one per step, then go dark."""
+    # Absolute monotonic deadlines keep a late wakeup from drifting the pattern
+    deadline = time.monotonic()
+    for mask in pattern:
+        write_leds(mask)
+        deadline += step
+        if led_stop.wait(max(0, deadline - time.monotonic())):
+            break
+    # A spin queued meanwhile starts straight away; don't blink dark first
+    if not spin_event.is_set():
+        all_off()
 
-def idle_pulse():
-    all_off()
+def led_worker():
+    """Play the light show whenever spin_event is set, off the poll thread."""
+    # Between shows this thread just blocks, with no timed wakeups
+    while not led_stop.is_set():
+        spin_event.wait()
+        if led_stop.is_set():
+            return
+        # Clear first so a busy poll during this spin queues the next one
+        spin_event.clear()
+        play_pattern(SPIN_PATTERN)
 
 def get_mount_device(mount_point="/srv/nas"):
     """Find the device (like /dev/sda1) that backs this mount."""
-    for part in psutil.disk_partitions(all=False):
-        if part.mountpoint == mount_point:
-            return os.path.basename(part.device)
-    return None
-
-def get_io_counters(dev_name):
-    """Return read/write bytes for given device name (e.g. sda1)."""
-    counters = psutil.disk_io_counters(perdisk=True)
-    return counters.get(dev_name, None)
+    device = None
+    with open("/proc/self/mountinfo") as f:
+        for line in f:
+            fields = line.split()
+            if fields[4] != mount_point:
+                continue
+            # Optional fields end at "-"; the mount source follows the fstype
+            source = fields[fields.index("-", 6) + 2]
+            # Keep going: the last entry is the one mounted on top
+            device = source if source.startswith("/dev/") else None
+    return os.path.basename(device) if device else None
 
-print("Starting NAS Activity Light Show. Press Ctrl+C to stop.")
+SECTOR_SIZE = 512  # block layer stats always count 512-byte sectors
+COUNTER_MASK = (1 << 64) - 1  # stat counters are unsigned longs and may wrap
+_stat_buf = bytearray(256)  # reused by every poll; the stat line is ~150 bytes
+# Sectors read/written are columns 2 and 6, matched straight out of the buffer
+STAT_PATTERN = re.compile(rb"\s*\d+\s+\d+\s+(\d+)\s+\d+\s+\d+\s+\d+\s+(\d+)")
 
-device = get_mount_device("/srv/nas")
-if not device:
-    print("Error: Could not find device for /srv/nas.")
-    GPIO.cleanup()
-    exit(1)
+def open_io_counters(dev_name):
+    """Open the sysfs stat file for a device (e.g. sda1) and return its fd."""
+    # /sys/class/block covers both whole disks and partitions
+    return os.open(f"/sys/class/block/{dev_name}/stat", os.O_RDONLY)
 
-print(f"Monitoring device: {device}")
+def get_io_counters(stat_fd):
+    """Return (read_bytes, write_bytes) from an open_io_counters() fd."""
+    n = os.preadv(stat_fd, [_stat_buf], 0)
+    m = STAT_PATTERN.match(_stat_buf, 0, n)
+    if not m:
+        return None
+    return int(m[1]) * SECTOR_SIZE, int(m[2]) * SECTOR_SIZE
 
-try:
-    last_io = get_io_counters(device)
-    if not last_io:
+def make_activity_sampler(stat_fd):
+    """Return a function giving bytes/sec moved since its previous call."""
+    io = get_io_counters(stat_fd)
+    if not io:
         raise RuntimeError("No IO stats found for device.")
+    preadv, monotonic, match = os.preadv, time.monotonic, STAT_PATTERN.match
+    buf, bufs = _stat_buf, [_stat_buf]
+    last_read = io[0] // SECTOR_SIZE
+    last_write = io[1] // SECTOR_SIZE
+    last_time = monotonic()
 
-    while True:
-        time.sleep(0.5)
-        current_io = get_io_counters(device)
-        if not current_io:
-            continue
+    def sample():
+        nonlocal last_read, last_write, last_time
+        m = match(buf, 0, preadv(stat_fd, bufs, 0))
+        if m is None:
+            # Unreadable stat line: no activity, diff against the last good one
+            return 0.0
+        read, write = int(m[1]), int(m[2])
+        now = monotonic()
+        # Masked deltas stay correct across a counter wrap
+        sectors = ((read - last_read) & COUNTER_MASK) + ((write - last_write) & COUNTER_MASK)
+        activity = sectors * SECTOR_SIZE / (now - last_time)
+        last_read = read
+        last_write = write
+        last_time = now
+        return activity
+
+    return sample
+
+def main():
+    global _chip
+    print("Starting NAS Activity Light Show. Press Ctrl+C to stop.")
+    install_signal_wakeup()
+    _chip = open_leds()
+
+    device = get_mount_device(NAS_MOUNT)
+    if not device:
+        print(f"Error: Could not find device for {NAS_MOUNT}.")
+        release_leds()
+        exit(1)
+
+    print(f"Monitoring device: {device}")
+    try:
+        stat_fd = open_io_counters(device)
+    except OSError as e:
+        print(f"Error: No sysfs IO stats for {device}: {e}")
+        release_leds()
+        exit(1)
+    fs_fd = open_fs_watch(NAS_MOUNT)
+
+    led_thread = threading.Thread(target=led_worker, daemon=True)
+    led_thread.start()
+
+    try:
+        sample_activity = make_activity_sampler(stat_fd)
+        poll_interval = POLL_INTERVAL
+        last_sample = time.monotonic()
+        ewma = 0.0
+        busy = False  # whether the last sample was over the threshold
+
+        # Bind everything the loop touches to locals
+        _wait = wait
+        _start_spin = spin_event.set
+        _min = min
+        _max = max
+        _monotonic = time.monotonic
+        _alpha = EWMA_ALPHA
+        _decay = 1 - EWMA_ALPHA
+        _threshold = ACTIVITY_THRESHOLD
+        _fast = POLL_INTERVAL
+        _slowest = MAX_POLL_INTERVAL
 
-        read_diff = current_io.read_bytes - last_io.read_bytes
-        write_diff = current_io.write_bytes - last_io.write_bytes
-        activity = read_diff + write_diff
-        last_io = current_io
+        while True:
+            # Only listen for file events while backed off
+            if _wait(poll_interval, fs_fd if poll_interval > _fast else None):
+                # Woken early: measure over at least a fast interval
+                _wait(_max(0.0, last_sample + _fast - _monotonic()))
+            activity = sample_activity()
+            last_sample = _monotonic()
+            # Smooth the rate so blips are ignored and bursts keep the show going
+            ewma = _alpha * activity + _decay * ewma
 
-        if activity > ACTIVITY_THRESHOLD:
-            print(f"Disk activity detected: {activity} bytes/s → light show!")
-            circular_spin(2)
-        else:
-            idle_pulse()
+            if ewma > _threshold:
+                if not busy:
+                    # Log once per busy spell, not on every fast poll
+                    print(f"Disk activity detected: {ewma:.0f} bytes/s → light show!")
+                    busy = True
+                _start_spin()
+                if poll_interval > _fast and fs_fd is not None:
+                    # Fast polls cover the burst; drop the events it queued
+                    drain_events(fs_fd)
+                poll_interval = _fast
+            else:
+                busy = False
+                if poll_interval == _fast and fs_fd is not None:
+                    # Events from the busy spell are stale
+                    drain_events(fs_fd)
+                # Nothing happening: poll less often until activity returns
+                poll_interval = _min(poll_interval * 2, _slowest)
 
-except KeyboardInterrupt:
-    print("\nExiting...")
+    except KeyboardInterrupt:
+        print("\nExiting...")
 
-finally:
-    all_off()
-    GPIO.cleanup()
+    finally:
+        led_stop.set()
+        spin_event.set()
+        led_thread.join()
+        all_off()
+        release_leds()
+        os.close(stat_fd)
+        if fs_fd is not None:
+            os.close(fs_fd)
 
+if __name__ == "__main__":
+    main()
@@ -3,24 +3,127 @@ import time
 import psutil
 import subprocess
 import threading
+import queue
 import random
 import socket
 import requests
+from requests.adapters import HTTPAdapter
 from collections import deque
 from gpiozero import Button, RotaryEncoder
 from board import SCL, SDA
 import busio
 from adafruit_ssd1306 import SSD1306_I2C
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFont
 from datetime import datetime
 
+# Let the NAS services win CPU contention; set before any thread starts
+PROCESS_NICE = 10
+os.nice(PROCESS_NICE)
+
 # -------------------------------
 # Display setup
 # -------------------------------
+# Blinka ignores the I2C frequency on Linux; for 1 MHz add to /boot/firmware/config.txt:
+#     dtparam=i2c_arm_baudrate=1000000
 WIDTH, HEIGHT = 128, 64
 i2c = busio.I2C(SCL, SDA)
 display = SSD1306_I2C(WIDTH, HEIGHT, i2c, addr=0x3C)
 
+# -------------------------------
+# Display flush
+# -------------------------------
+# Send only the changed window of the framebuffer, setup and pixels in one I2C transaction
+PAGES = HEIGHT // 8
+SET_COL_ADDR = 0x21
+SET_PAGE_ADDR = 0x22
+_display_lock = threading.Lock()
+_shown = None  # page-ordered bytes currently on the panel
+
+def pack_frame(image):
+    # Return a 1-bit image as SSD1306 page-ordered bytes
+    # Rotated 270 degrees, each column packs to one byte per page, last page first
+    cols = image.transpose(Image.ROTATE_270).tobytes()
+    frame = bytearray(WIDTH * PAGES)
+    for page in range(PAGES):
+        frame[page * WIDTH:(page + 1) * WIDTH] = cols[PAGES - 1 - page::PAGES]
+    return frame
+
+def _changed_span(old, new):
+    # Return (first, last) index where two equal-length buffers differ, or None
+    diff = int.from_bytes(old, "big") ^ int.from_bytes(new, "big")
+    if not diff:
+        return None
+    n = len(old)
+    first = n - (diff.bit_length() + 7) // 8
+    last = n - 1 - ((diff & -diff).bit_length() - 1) // 8
+    return first, last
+
+_blit_source = (None, None)  # (image.tobytes(), packed) of the last blit()
+
+def blit(image):
+    # Show image, sending only the part of the panel that changed
+    global _blit_source
+    # An identical image still on the panel needs neither packing nor a diff
+    raw = image.tobytes()
+    if raw == _blit_source[0] and _shown is _blit_source[1]:
+        return
+    frame = pack_frame(image)
+    _blit_source = (raw, frame)
+    blit_raw(frame)
+
+def blit_raw(frame):
+    # Show a pack_frame() buffer; frames shown repeatedly can be packed once
+    global _shown
+    with _display_lock:
+        if _shown is None:
+            window = (0, PAGES - 1, 0, WIDTH - 1)
+        else:
+            window = None
+            for page in range(PAGES):
+                start = page * WIDTH
+                span = _changed_span(_shown[start:start + WIDTH], frame[start:start + WIDTH])
+                if span is None:
+                    continue
+                if window is None:
+                    window = (page, page, span[0], span[1])
+                else:
+                    window = (window[0], page, min(window[2], span[0]), max(window[3], span[1]))
+            if window is None:
+                _shown = frame  # same content; keeps identity checks valid
+                return
+        p0, p1, c0, c1 = window
+        display.buffer[1:] = frame
+        # 0x80 before each command byte, then 0x40: the rest is pixel data
+        data = bytearray()
+        for cmd in (SET_COL_ADDR, c0, c1, SET_PAGE_ADDR, p0, p1):
+            data += bytes((0x80, cmd))
+        data.append(0x40)
+        for page in range(p0, p1 + 1):
+            data += frame[page * WIDTH + c0:page * WIDTH + c1 + 1]
+        try:
+            with display.i2c_device:
+                display.i2c_device.write(data)
+        except Exception:
+            _shown = None  # panel contents unknown: resend it all next time
+            raise
+        _shown = frame
+
+# Slides hand frames to a writer thread so sending overlaps preparing the next
+_flush_queue = queue.Queue(maxsize=2)
+
+def _display_writer():
+    while True:
+        frame = _flush_queue.get()
+        try:
+            blit_raw(frame)
+        except Exception as e:
+            # Drop this frame only; a dead writer would hang every slide
+            print(f"Display write failed: {e}")
+        finally:
+            _flush_queue.task_done()
+
+threading.Thread(target=_display_writer, daemon=True).start()
+
 # -------------------------------
 # Fonts
 # -------------------------------
@@ -63,6 +166,8 @@ selected_index = 0
 menu_offset = 0  # first visible index
 submenu_thread = None
 stop_event = threading.Event()
+# Set while a submenu screen runs; a plain flag read, unlike is_alive()
+_submenu_active = threading.Event()
 
 # -------------------------------
 # Background dashboard state
@@ -72,18 +177,18 @@ ZIP = "32084"
 LAT, LON = 29.8922, -81.3139
 WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
 WEATHER_UPDATE_INTERVAL = 600  # seconds
-last_weather_update = 0
+WEATHER_RETRY_INTERVAL = 60    # seconds, after a failed fetch
+# One kept-alive connection to the weather API, reused by every refresh
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "nasberrypi/1"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
 cached_weather = {"temp_f": 0, "condition": "sun", "forecast": []}
 
-# Disk activity
-last_disk_io = psutil.disk_io_counters(perdisk=True).get("sda", None)
-last_reads, last_writes = (last_disk_io.read_count, last_disk_io.write_count) if last_disk_io else (0, 0)
-disk_active = False
-blink_timer = 0
-
-# Network throughput
-last_net = psutil.net_io_counters(pernic=True).get(NET_IFACE, None)
-last_bytes = (last_net.bytes_sent + last_net.bytes_recv) if last_net else 0
+# System stats, refreshed once a second by sys_sampler()
+DISK_NAME = "sda"
+SAMPLE_INTERVAL = 1.0
+sys_stats = {"cpu_temp": 0.0, "load1": 0.0, "ram_pct": 0.0,
+             "disk_active": False, "net_rate": 0.0}
 
 # Load graph buffer
 load_history = deque(maxlen=50)
@@ -91,15 +196,20 @@ load_history = deque(maxlen=50)
 # View management
 current_view = "menu"  # "menu" or "background"
 show_weather = False
-background_cycle_start = 0.0
+background_swap_at = 0.0  # time.monotonic() of the next system/weather swap
 
 # Idle logic
 IDLE_TIMEOUT = 30.0   # seconds on main menu
-last_user_activity = time.time()
+idle_deadline = time.monotonic() + IDLE_TIMEOUT  # pushed back by any input
 
 # Fade timing
 FADE_DURATION = 0.5   # seconds to fade back to menu
 
+# The main loop sleeps until its next deadline; input handlers set wake
+BACKGROUND_SWAP_INTERVAL = 15  # seconds between system and weather
+BACKGROUND_TICK = 0.25   # dashboard refresh while the background shows
+wake = threading.Event()
+
 # -------------------------------
 # Helpers: GPIO gating for menu rotation callbacks
 # -------------------------------
@@ -122,35 +232,113 @@ def now_ts():
     return time.time()
 
 def mark_activity():
-    global last_user_activity
-    last_user_activity = now_ts()
+    global idle_deadline
+    idle_deadline = time.monotonic() + IDLE_TIMEOUT
+    wake.set()  # the idle deadline moved
+
+# The address rarely changes, so the route lookup is done at most this often
+IP_CACHE_TTL = 30.0
+_ip_cache = {"t": float("-inf"), "v": "--"}
 
 def get_ip_last_octet():
+    if time.monotonic() - _ip_cache["t"] < IP_CACHE_TTL:
+        return _ip_cache["v"]
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
         ip = s.getsockname()[0]
         s.close()
-        return ip.split(".")[-1]
+        octet = ip.split(".")[-1]
     except:
-        return "--"
+        octet = "--"
+    _ip_cache["t"] = time.monotonic()
+    _ip_cache["v"] = octet
+    return octet
+
+# Stat files stay open and are re-read from the top each sample
+def _open_stat(path):
+    try:
+        return open(path, "r")
+    except OSError:
+        return None
+
+_THERMAL = _open_stat("/sys/class/thermal/thermal_zone0/temp")
+_LOADAVG = _open_stat("/proc/loadavg")
+_MEMINFO = _open_stat("/proc/meminfo")
+_DISKSTATS = _open_stat("/proc/diskstats")
+_NETDEV = _open_stat("/proc/net/dev")
+
+def _read_stat(f):
+    if f is None:
+        raise OSError("stat file not available")
+    f.seek(0)
+    return f.read()
 
 def get_cpu_temp():
     try:
-        with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
-            return float(f.read()) / 1000
+        return float(_read_stat(_THERMAL)) / 1000
     except:
         return 0.0
 
-def get_net_activity_bytes():
-    global last_bytes
-    now_net = psutil.net_io_counters(pernic=True).get(NET_IFACE, None)
-    if not now_net:
-        return 0
-    now_total = now_net.bytes_sent + now_net.bytes_recv
-    diff = max(0, now_total - last_bytes)
-    last_bytes = now_total
-    return diff  # bytes since last call
+def read_proc_counters():
+    # Return (load1, ram_pct, disk_ios, net_bytes) straight from /proc
+    load1 = float(_read_stat(_LOADAVG).split(None, 1)[0])
+    mem = {}
+    for line in _read_stat(_MEMINFO).splitlines():
+        key, value = line.split(":", 1)
+        mem[key] = int(value.split()[0])
+    ram_pct = 100.0 * (mem["MemTotal"] - mem["MemAvailable"]) / mem["MemTotal"]
+    disk_ios = None
+    for line in _read_stat(_DISKSTATS).splitlines():
+        fields = line.split()
+        if fields[2] == DISK_NAME:
+            disk_ios = int(fields[3]) + int(fields[7])
+            break
+    net_bytes = None
+    for line in _read_stat(_NETDEV).splitlines():
+        name, sep, rest = line.partition(":")
+        if sep and name.strip() == NET_IFACE:
+            fields = rest.split()
+            net_bytes = int(fields[0]) + int(fields[8])
+            break
+    return load1, ram_pct, disk_ios, net_bytes
+
+def read_psutil_counters():
+    # Same as read_proc_counters(), via psutil
+    disk = psutil.disk_io_counters(perdisk=True).get(DISK_NAME)
+    net = psutil.net_io_counters(pernic=True).get(NET_IFACE)
+    return (psutil.getloadavg()[0],
+            psutil.virtual_memory().percent,
+            disk.read_count + disk.write_count if disk else None,
+            net.bytes_sent + net.bytes_recv if net else None)
+
+def sys_sampler():
+    # Fill sys_stats and load_history once a second for the dashboard
+    read_counters = read_proc_counters
+    last_ios = last_net = None
+    last_t = time.monotonic()
+    while True:
+        try:
+            load1, ram_pct, ios, net = read_counters()
+        except (OSError, ValueError, KeyError, IndexError, ZeroDivisionError):
+            # /proc looks different than expected: let psutil do the parsing
+            read_counters = read_psutil_counters
+            try:
+                load1, ram_pct, ios, net = read_counters()
+            except Exception:
+                # Nothing readable: keep the previous counters and retry
+                time.sleep(SAMPLE_INTERVAL)
+                continue
+        now = time.monotonic()
+        sys_stats["cpu_temp"] = get_cpu_temp()
+        sys_stats["load1"] = load1
+        sys_stats["ram_pct"] = ram_pct
+        sys_stats["disk_active"] = ios is not None and last_ios is not None and ios != last_ios
+        if net is not None and last_net is not None:
+            sys_stats["net_rate"] = max(0, net - last_net) / (now - last_t)
+        load_history.append(load1)
+        last_ios, last_net, last_t = ios, net, now
+        time.sleep(SAMPLE_INTERVAL)
 
 def draw_cut_corner_box(draw, x1, y1, x2, y2, title):
     draw.rectangle((x1, y1, x2, y2), outline=255, fill=0)
@@ -161,10 +349,37 @@ def draw_cut_corner_box(draw, x1, y1, x2, y2, title):
     )
     draw.text((x1 + 3, y1 - 1), title, font=font_small, fill=0)
 
-def get_weather():
-    global last_weather_update, cached_weather
-    if now_ts() - last_weather_update < WEATHER_UPDATE_INTERVAL:
-        return cached_weather
+# Pre-drawn CPU/RAM boxes plus their title row, pasted at (x1, y1 - 1) with a mask
+def _prerender_box(title, width=82, height=29):
+    image = Image.new("1", (width, height + 1))
+    draw_cut_corner_box(ImageDraw.Draw(image), 0, 1, width - 1, height, title)
+    mask = Image.new("1", (width, height + 1))
+    mask_draw = ImageDraw.Draw(mask)
+    mask_draw.rectangle((0, 1, width - 1, height), fill=255)
+    mask_draw.text((3, 0), title, font=font_small, fill=255)
+    return image, mask
+
+_CPU_BOX = _prerender_box("CPU")
+_RAM_BOX = _prerender_box("RAM")
+
+# Bar graphs in a few whole-image ops: lit where the column height beats the ramp
+_BAR_RAMPS = {}
+_BAR_LUT = [0] + [255] * 255
+
+def bar_graph_mask(heights, rows):
+    # Return a mode "1" mask with a bottom-aligned bar of heights[i] pixels in column i
+    ramp = _BAR_RAMPS.get(rows)
+    if ramp is None:
+        # Each row holds the bar height it takes to reach it, less one
+        ramp = Image.frombytes("L", (1, rows), bytes(range(rows - 1, -1, -1)))
+        ramp = _BAR_RAMPS[rows] = ramp.resize((WIDTH, rows), Image.NEAREST)
+    n = len(heights)
+    bars = Image.frombytes("L", (n, 1), bytes(heights)).resize((n, rows), Image.NEAREST)
+    return ImageChops.subtract(bars, ramp.crop((0, 0, n, rows))).point(_BAR_LUT, "1")
+
+def refresh_weather():
+    # Fetch the forecast into cached_weather; return True on success
+    global cached_weather
     params = {
         "latitude": LAT,
         "longitude": LON,
@@ -173,7 +388,7 @@ def get_weather():
         "timezone": "America/New_York"
     }
     try:
-        r = requests.get(WEATHER_URL, params=params, timeout=5)
+        r = _SESSION.get(WEATHER_URL, params=params, timeout=5)
         data = r.json()
         cur = data["current_weather"]
         temp_c = cur["temperature"]
@@ -188,10 +403,17 @@ def get_weather():
         temps = hourly.get("temperature_2m", [temp_c])[:4]
         temp_fs = [t * 9/5 + 32 for t in temps]
         cached_weather = {"temp_f": temp_f, "condition": cond, "forecast": temp_fs}
-        last_weather_update = now_ts()
+        return True
     except Exception:
-        pass
-    return cached_weather
+        return False
+
+def weather_poller():
+    # Keep cached_weather fresh so the weather screen never waits on the network
+    while True:
+        if refresh_weather():
+            time.sleep(WEATHER_UPDATE_INTERVAL)
+        else:
+            time.sleep(WEATHER_RETRY_INTERVAL)
 
 def draw_weather_icon(draw, x, y, cond):
     # simple monochrome icons
@@ -209,38 +431,83 @@ def draw_weather_icon(draw, x, y, cond):
     else:
         draw.ellipse((x+2, y+6, x+22, y+18), outline=255, fill=255)
 
+# Icons are rasterized once with a mask of every pixel drawn, fill=0 included
+WEATHER_ICON_SIZE = 24
+
+def _prerender_icon(cond):
+    size = (WEATHER_ICON_SIZE, WEATHER_ICON_SIZE)
+    image = Image.new("1", size)
+    draw_weather_icon(ImageDraw.Draw(image), 0, 0, cond)
+    # Drawn pixels come out the same on black and white; untouched ones don't
+    on_white = Image.new("1", size, 255)
+    draw_weather_icon(ImageDraw.Draw(on_white), 0, 0, cond)
+    mask = ImageChops.logical_or(image, ImageChops.invert(on_white))
+    return image, mask
+
+_ICONS = {}
+for _cond in ("sun", "rain", "snow", "storm", "cloud"):
+    _ICONS[_cond] = _prerender_icon(_cond)
+
 # -------------------------------
 # Background: system screen
 # -------------------------------
-def draw_system_screen():
-    global last_reads, last_writes, disk_active, blink_timer, load_history
+# Ethernet bar and disk LED states are drawn once and pasted
+NET_BARS_BOX = (113, 51, 125, 60)
+DISK_LED_BOX = (44, 60, 50, 64)
 
+def _draw_net_bars(draw, bars):
+    base_x = 113  # shifted left 2 px
+    base_y = 59   # shifted up 2 px
+    for i in range(3):
+        bx1 = base_x + (i * 4)
+        bx2 = bx1 + 3
+        by1 = base_y - (i + 1) * 2
+        # hollow outline
+        draw.rectangle((bx1, by1 - 2, bx2, base_y), outline=255, fill=255 if i < bars else 0)
+
+def _prerender(box, paint):
     image = Image.new("1", (WIDTH, HEIGHT))
-    draw = ImageDraw.Draw(image)
+    paint(ImageDraw.Draw(image))
+    return image.crop(box)
+
+_NET_BARS = [_prerender(NET_BARS_BOX, lambda d, n=n: _draw_net_bars(d, n)) for n in range(4)]
+# Only the bars themselves are pasted, not the gaps above the short ones
+_NET_BARS_MASK = _prerender(NET_BARS_BOX, lambda d: _draw_net_bars(d, 3))
+_DISK_LED = [
+    _prerender(DISK_LED_BOX, lambda d, on=on: d.rectangle((44, 60, 49, 63), outline=255, fill=255 if on else 0))
+    for on in (False, True)
+]
 
+LOAD_GRAPH_COLUMNS = 36
+LOAD_GRAPH_HEIGHT = 12
+
+def system_view():
+    # Values as displayed, so this doubles as the frame cache key
     now = datetime.now()
-    hour = now.strftime("%H")
-    minute = now.strftime("%M")
-    month = now.strftime("%b")
-    day = now.strftime("%d")
-
-    cpu_temp = get_cpu_temp()
-    load_avg = psutil.getloadavg()[0]
-    ram_used = psutil.virtual_memory().percent / 10
-    ip_octet = get_ip_last_octet()
-    load_history.append(load_avg)
-
-    # Disk activity check
-    disk_stats = psutil.disk_io_counters(perdisk=True).get("sda", None)
-    if disk_stats:
-        if disk_stats.read_count > last_reads or disk_stats.write_count > last_writes:
-            disk_active = True
-            blink_timer = 3
-        last_reads, last_writes = disk_stats.read_count, disk_stats.write_count
-    if blink_timer > 0:
-        blink_timer -= 1
-    else:
-        disk_active = False
+    max_h = LOAD_GRAPH_HEIGHT
+    heights = tuple(int(min(v / 2.0 * max_h, max_h)) + 1
+                    for v in list(load_history)[-LOAD_GRAPH_COLUMNS:])
+    kbps = sys_stats["net_rate"] / 1024.0
+    bars = 0
+    if kbps > 50:  bars = 1
+    if kbps > 150: bars = 2
+    if kbps > 400: bars = 3
+    return (now.strftime("%H"), now.strftime("%M"), now.strftime("%b"), now.strftime("%d"),
+            get_ip_last_octet(),
+            f"{sys_stats['cpu_temp']:>4.0f}°",  # tenths of a degree just flicker
+            f"{sys_stats['ram_pct'] / 10:>4.1f}",
+            heights, bars, sys_stats["disk_active"])
+
+# Dashboards draw into persistent scratch images; keep a frame by copying it
+_system_img = Image.new("1", (WIDTH, HEIGHT))
+_system_draw = ImageDraw.Draw(_system_img)
+
+def draw_system_screen(view=None):
+    hour, minute, month, day, ip_octet, temp_text, ram_text, heights, bars, disk_active = (
+        view or system_view())
+
+    image, draw = _system_img, _system_draw
+    draw.rectangle((0, 0, WIDTH, HEIGHT), fill=0)
 
     # Time, big
     draw.text((0, -4), hour, font=font_large, fill=255)
@@ -250,123 +517,233 @@ def draw_system_screen():
     draw.text((28, 48), day, font=font_mid, fill=0)
 
     # CPU box
-    draw_cut_corner_box(draw, 46, 0, 127, 28, "CPU")
+    image.paste(_CPU_BOX[0], (46, -1), _CPU_BOX[1])
     draw.text((88, 2), f"IP {ip_octet}", font=font_small, fill=255)
-    draw.text((50, 14), f"{cpu_temp:>4.1f}°", font=font_small, fill=255)
+    draw.text((50, 14), temp_text, font=font_small, fill=255)
 
     # CPU load graph area
-    base_x, base_y, max_h = 90, 27, 12
-    for i, v in enumerate(list(load_history)[-36:]):
-        h = int(min(v / 2.0 * max_h, max_h))
-        draw.line((base_x + i, base_y, base_x + i, base_y - h), fill=255)
+    base_x, base_y, max_h = 90, 27, LOAD_GRAPH_HEIGHT
+    if heights:
+        image.paste(255, (base_x, base_y - max_h), bar_graph_mask(heights, max_h + 1))
 
     # RAM box
-    draw_cut_corner_box(draw, 46, 34, 127, 62, "RAM")
-    draw.text((50, 48), f"{ram_used:>4.1f}", font=font_small, fill=255)
+    image.paste(_RAM_BOX[0], (46, 33), _RAM_BOX[1])
+    draw.text((50, 48), ram_text, font=font_small, fill=255)
 
     # Ethernet activity bars (hollow boxes that fill)
-    net_bytes = get_net_activity_bytes()
-    kbps = net_bytes * 2 / 1024.0
-    bars = 0
-    if kbps > 50:  bars = 1
-    if kbps > 150: bars = 2
-    if kbps > 400: bars = 3
-
-    base_x = 113  # shifted left 2 px
-    base_y = 59   # shifted up 2 px
-    for i in range(3):
-        bx1 = base_x + (i * 4)
-        bx2 = bx1 + 3
-        by1 = base_y - (i + 1) * 2
-        # hollow outline
-        draw.rectangle((bx1, by1 - 2, bx2, base_y), outline=255, fill=255 if i < bars else 0)
+    image.paste(_NET_BARS[bars], NET_BARS_BOX[:2], _NET_BARS_MASK)
 
     # Disk LED
-    draw.rectangle((44, 60, 49, 63), outline=255, fill=255 if disk_active else 0)
+    image.paste(_DISK_LED[disk_active], DISK_LED_BOX[:2])
     return image
 
 # -------------------------------
 # Background: weather screen
 # -------------------------------
-def draw_weather_screen():
-    image = Image.new("1", (WIDTH, HEIGHT))
-    draw = ImageDraw.Draw(image)
-    weather = get_weather()
-    cond = weather["condition"]
-    temp_f = weather["temp_f"]
-    forecast = weather["forecast"]
+def weather_view():
+    # Return what the weather screen shows, formatted as drawn
+    weather = cached_weather
+    return (f"{weather['temp_f']:.0f}°F", weather["condition"],
+            tuple(f"{t:.0f}°" for t in weather["forecast"]))
+
+_weather_img = Image.new("1", (WIDTH, HEIGHT))
+_weather_draw = ImageDraw.Draw(_weather_img)
+
+def draw_weather_screen(view=None):
+    temp_text, cond, forecast = view or weather_view()
+    image, draw = _weather_img, _weather_draw
+    draw.rectangle((0, 0, WIDTH, HEIGHT), fill=0)
 
-    draw.text((10, 5), f"{temp_f:.0f}°F", font=font_temp, fill=255)
-    draw_weather_icon(draw, 90, 12, cond)
+    draw.text((10, 5), temp_text, font=font_temp, fill=255)
+    icon, mask = _ICONS[cond]
+    image.paste(icon, (90, 12), mask)
 
     fx = 10
     fy = 48
     for t in forecast:
-        draw.text((fx, fy), f"{t:.0f}°", font=font_small, fill=255)
+        draw.text((fx, fy), t, font=font_small, fill=255)
         fx += 30
     return image
 
+# -------------------------------
+# Background frame cache
+# -------------------------------
+# Dashboard frames are keyed on their view tuples and only redrawn when those change
+_frame_cache = {}  # screen name -> (key, image)
+_render_lock = threading.Lock()  # the renderers share scratch images
+_bg_image = None  # background frame currently on the panel
+
+def _cached_frame(name, key, render):
+    with _render_lock:
+        hit = _frame_cache.get(name)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        # Copy out of the scratch image: slides and _bg_image hold cached frames
+        image = render().copy()
+        _frame_cache[name] = (key, image)
+        return image
+
+def system_frame():
+    view = system_view()
+    return _cached_frame("system", view, lambda: draw_system_screen(view))
+
+def weather_frame():
+    view = weather_view()
+    return _cached_frame("weather", view, lambda: draw_weather_screen(view))
+
+def background_frame():
+    # The frame for whichever background screen is selected
+    return weather_frame() if show_weather else system_frame()
+
 # -------------------------------
 # Transitions
 # -------------------------------
+# Packed slide frames by (from, to, step); entries keep the images so ids stay unique
+SLIDE_CACHE_SIZE = 4
+_slide_cache = {}  # (id(from), id(to), step) -> (from, to, frames)
+
+def _slide_frames(img_from, img_to, step):
+    key = (id(img_from), id(img_to), step)
+    hit = _slide_cache.get(key)
+    if hit is not None and hit[0] is img_from and hit[1] is img_to:
+        return hit[2]
+    # Both endpoints side by side once; every step is then a single crop
+    strip = Image.new("1", (2 * WIDTH, HEIGHT))
+    strip.paste(img_from, (0, 0))
+    strip.paste(img_to, (WIDTH, 0))
+    frames = [bytes(pack_frame(strip.crop((offset, 0, offset + WIDTH, HEIGHT))))
+              for offset in range(0, WIDTH + 1, step)]
+    if len(_slide_cache) >= SLIDE_CACHE_SIZE:
+        del _slide_cache[next(iter(_slide_cache))]  # oldest entry
+    _slide_cache[key] = (img_from, img_to, frames)
+    return frames
+
 def slide_transition(img_from, img_to, delay=0.01, step=8):
-    for offset in range(0, WIDTH + 1, step):
-        frame = Image.new("1", (WIDTH, HEIGHT))
-        frame.paste(img_from, (-offset, 0))
-        frame.paste(img_to, (WIDTH - offset, 0))
-        display.image(frame)
-        display.show()
+    for frame in _slide_frames(img_from, img_to, step):
+        _flush_queue.put(frame)
         time.sleep(delay)
+    # Finish on the panel before anyone blits over it directly
+    _flush_queue.join()
 
-def fade_to_menu(from_img, to_menu_img, duration=FADE_DURATION, steps=10):
-    # Dissolve style: progressively reveal menu rows
-    delay = max(0.01, duration / steps)
+def _build_fade_masks(steps):
+    # Dissolve masks per fade step; mask k-1 reveals rows with y % steps < k
+    masks = []
     for k in range(1, steps + 1):
-        frame = Image.new("1", (WIDTH, HEIGHT))
-        frame.paste(from_img, (0, 0))
-        # mask reveals rows where y % steps < k
         mask = Image.new("1", (WIDTH, HEIGHT), 0)
-        md = ImageDraw.Draw(mask)
         for y in range(HEIGHT):
             if (y % steps) < k:
-                md.line((0, y, WIDTH, y), fill=1)
+                mask.paste(1, (0, y, WIDTH, y + 1))
+        masks.append(mask)
+    return masks
+
+_FADE_MASKS = _build_fade_masks(10)
+
+def fade_to_menu(from_img, to_menu_img, duration=FADE_DURATION, steps=10):
+    # Dissolve style: progressively reveal menu rows
+    delay = max(0.01, duration / steps)
+    masks = _FADE_MASKS if steps == len(_FADE_MASKS) else _build_fade_masks(steps)
+    frame = Image.new("1", (WIDTH, HEIGHT))
+    for mask in masks:
+        frame.paste(from_img, (0, 0))
         frame.paste(to_menu_img, (0, 0), mask)
-        display.image(frame)
-        display.show()
+        blit(frame)
         time.sleep(delay)
 
 # -------------------------------
 # Menu rendering and helpers
 # -------------------------------
-def show_menu():
-    global menu_offset
-    image = Image.new("1", (WIDTH, HEIGHT))
-    draw = ImageDraw.Draw(image)
+# Each item is rasterized once into a row mask and pasted per frame
+MENU_ROW_PITCH = 8
+MENU_ROW_MASK_HEIGHT = 16  # glyphs overhang the row pitch
+
+def _build_menu_rows():
+    rows = []
+    for item in menu_items:
+        mask = Image.new("1", (WIDTH, MENU_ROW_MASK_HEIGHT))
+        ImageDraw.Draw(mask).text((2, 0), item, font=font, fill=255)
+        rows.append(mask)
+    return rows
 
+_MENU_ROWS = _build_menu_rows()
+
+def _scroll_to_selection():
+    global menu_offset
     # Ensure selected item is visible
     if selected_index < menu_offset:
         menu_offset = selected_index
     elif selected_index >= menu_offset + VISIBLE_LINES:
         menu_offset = selected_index - VISIBLE_LINES + 1
 
-    visible_items = menu_items[menu_offset:menu_offset + VISIBLE_LINES]
-
-    total_height = len(visible_items) * 8
-    top_margin = max(0, (HEIGHT - total_height) // 2)
-
-    for i, item in enumerate(visible_items):
-        y = top_margin + i * 8
-        absolute_index = menu_offset + i
+def _menu_row_y(index):
+    # Screen y of menu item index at the current scroll position
+    visible = min(VISIBLE_LINES, len(menu_items) - menu_offset)
+    top_margin = max(0, (HEIGHT - visible * MENU_ROW_PITCH) // 2)
+    return top_margin + (index - menu_offset) * MENU_ROW_PITCH
+
+def _paint_menu(image, top=0):
+    # image may be a band of the screen starting at row top
+    _scroll_to_selection()
+    visible = min(VISIBLE_LINES, len(menu_items) - menu_offset)
+
+    # Rows are pasted in order so overlapping glyphs stack as draw.text did
+    for absolute_index in range(menu_offset, menu_offset + visible):
+        y = _menu_row_y(absolute_index) - top
+        if y + MENU_ROW_MASK_HEIGHT <= 0 or y >= image.height:
+            continue
         if absolute_index == selected_index:
-            draw.rectangle([0, y, WIDTH - 1, y + 8], fill=255)
-            draw.text((2, y), item, font=font, fill=0)
+            image.paste(255, (0, y, WIDTH, y + MENU_ROW_PITCH + 1))
+            image.paste(0, (0, y), _MENU_ROWS[absolute_index])
         else:
-            draw.text((2, y), item, font=font, fill=255)
+            image.paste(255, (0, y), _MENU_ROWS[absolute_index])
+
+# Last menu frame, packed bytes and (offset, selection); guarded by _menu_lock
+_menu_frame = None
+_menu_packed = None
+_menu_layout = None
+_menu_lock = threading.RLock()
 
-    display.image(image)
-    display.show()
+def show_menu():
+    with _menu_lock:
+        return _show_menu()
+
+def _show_menu():
+    global _menu_frame, _menu_packed, _menu_layout
+    _scroll_to_selection()
+    if _menu_layout == (menu_offset, selected_index):
+        blit_raw(_menu_packed)
+        return _menu_frame
+    image = Image.new("1", (WIDTH, HEIGHT))
+    _paint_menu(image)
+    _menu_frame = image
+    _menu_packed = bytes(pack_frame(image))
+    _menu_layout = (menu_offset, selected_index)
+    blit_raw(_menu_packed)
     return image  # return the image so we can slide away from it
 
+def move_menu_selection():
+    # Show a new selected_index, repainting only the rows it left and entered
+    with _menu_lock:
+        _move_menu_selection()
+
+def _move_menu_selection():
+    global _menu_packed, _menu_layout
+    _scroll_to_selection()
+    if _menu_layout is None or _menu_layout[0] != menu_offset:
+        show_menu()  # the list scrolled: every row moved
+        return
+    previous = _menu_layout[1]
+    if previous == selected_index:
+        return
+    # A row stays within MENU_ROW_MASK_HEIGHT of its top, so repaint those bands
+    for index in (previous, selected_index):
+        y = _menu_row_y(index)
+        band = Image.new("1", (WIDTH, min(MENU_ROW_MASK_HEIGHT, HEIGHT - y)))
+        _paint_menu(band, y)
+        _menu_frame.paste(band, (0, y))
+    _menu_layout = (menu_offset, selected_index)
+    _menu_packed = bytes(pack_frame(_menu_frame))
+    blit_raw(_menu_packed)
+
 def system_call(cmd):
     try:
         subprocess.run(cmd, shell=True)
@@ -381,8 +758,7 @@ def show_text(lines, center=False):
         w, _ = draw.textsize(line, font=font)
         x = (WIDTH - w) // 2 if center else 0
         draw.text((x, i * 10), line, font=font, fill=255)
-    display.image(image)
-    display.show()
+    blit(image)
 
 # -------------------------------
 # Submenu screens (from your code)
@@ -430,6 +806,10 @@ def screen_spaceinvaders():
     old_knob_handler = btn_knob.when_pressed
     btn_knob.when_pressed = fire_bullet
 
+    # One frame buffer for the whole game, cleared at the top of each frame
+    image = Image.new("1", (width, height))
+    draw = ImageDraw.Draw(image)
+
     try:
         while True:
             if stop_event.is_set() or btn_back.is_pressed:
@@ -446,40 +826,46 @@ def screen_spaceinvaders():
                     player_x = max(0, min(width - 6, player_x))
                 last_steps = encoder.steps
 
+            # aliens stays row-major: aliens[0] is the top row, aliens[-1] the bottom
             if aliens:
-                projected_out_of_bounds = any(
-                    (ax + alien_dir * alien_step_x) < 0 or (ax + alien_dir * alien_step_x) > (width - 8)
-                    for ax, _ in aliens
-                )
+                dx = alien_dir * alien_step_x
+                # Lists compare by x first, so min/max give the edge columns
+                projected_out_of_bounds = min(aliens)[0] + dx < 0 or max(aliens)[0] + dx > width - 8
                 move_down = projected_out_of_bounds and (now - last_alien_move_time >= alien_move_interval)
                 if move_down:
                     last_alien_move_time = now
                     alien_dir *= -1
-                    aliens = [[ax, ay + 4] for ax, ay in aliens]
+                    for a in aliens:
+                        a[1] += 4
+                elif projected_out_of_bounds:
+                    for a in aliens:
+                        a[0] = max(0, min(width - 8, a[0] + dx))
                 else:
-                    new_aliens = []
-                    for ax, ay in aliens:
-                        nx = ax + alien_dir * alien_step_x
-                        nx = max(0, min(width - 8, nx))
-                        new_aliens.append([nx, ay])
-                    aliens = new_aliens
-
-            bullets = [[bx, by - bullet_speed] for bx, by in bullets if by - bullet_speed > 0]
-
-            for b in list(bullets):
-                bx, by = b
-                hit_idx = None
-                for idx, (ax, ay) in enumerate(aliens):
-                    if abs(bx - ax) < 4 and abs(by - ay) < 4:
-                        hit_idx = idx
-                        break
-                if hit_idx is not None:
-                    try:
-                        bullets.remove(b)
-                    except ValueError:
-                        pass
-                    del aliens[hit_idx]
-                    score += 10
+                    for a in aliens:
+                        a[0] += dx
+
+            for b in bullets:
+                b[1] -= bullet_speed
+            bullets = [b for b in bullets if b[1] > 0]
+
+            if aliens and bullets:
+                # Only bullets level with the formation can hit anything
+                top, bottom = aliens[0][1] - 4, aliens[-1][1] + 4
+                survivors = []
+                for b in bullets:
+                    bx, by = b
+                    hit_idx = None
+                    if top < by < bottom:
+                        for idx, (ax, ay) in enumerate(aliens):
+                            if abs(bx - ax) < 4 and abs(by - ay) < 4:
+                                hit_idx = idx
+                                break
+                    if hit_idx is None:
+                        survivors.append(b)
+                    else:
+                        del aliens[hit_idx]
+                        score += 10
+                bullets = survivors
 
             if not aliens:
                 alien_rows = min(alien_rows + 1, 5)
@@ -490,19 +876,15 @@ def screen_spaceinvaders():
                 ]
                 alien_dir = 1
 
-            if any(ay >= player_y - 2 for _, ay in aliens):
-                image = Image.new("1", (width, height))
-                draw = ImageDraw.Draw(image)
+            if aliens and aliens[-1][1] >= player_y - 2:
+                draw.rectangle((0, 0, width, height), fill=0)
                 draw.text((30, 24), "GAME OVER", font=font, fill=255)
                 draw.text((35, 40), f"Score {score}", font=font, fill=255)
-                display.image(image)
-                display.show()
+                blit(image)
                 _t.sleep(1.5)
                 return
 
-            image = Image.new("1", (width, height))
-            draw = ImageDraw.Draw(image)
-
+            draw.rectangle((0, 0, width, height), fill=0)
             draw.text((2, 0), f"SCORE {score}", font=font, fill=255)
 
             for ax, ay in aliens:
@@ -519,8 +901,7 @@ def screen_spaceinvaders():
                 except Exception:
                     pass
 
-            display.image(image)
-            display.show()
+            blit(image)
             _t.sleep(frame_delay)
     finally:
         btn_knob.when_pressed = old_knob_handler
@@ -535,8 +916,11 @@ def screen_gameoflife():
     frame_delay = 0.1
     regenerate_event = threading.Event()
 
+    full_row = (1 << cols) - 1
+
+    # One int per row, bit x is column x: a row updates in a few bitwise ops
     def randomize_grid():
-        return [[random.randint(0, 1) for _ in range(cols)] for _ in range(rows)]
+        return [random.getrandbits(cols) for _ in range(rows)]
 
     def regenerate_pressed():
         regenerate_event.set()
@@ -545,25 +929,48 @@ def screen_gameoflife():
     btn_knob.when_pressed = regenerate_pressed
     grid = randomize_grid()
 
-    def count_neighbors(x, y):
-        return sum(
-            grid[(y + dy) % rows][(x + dx) % cols]
-            for dy in (-1, 0, 1)
-            for dx in (-1, 0, 1)
-            if not (dx == 0 and dy == 0)
-        )
+    def west(r):
+        # Each cell's left-hand neighbour, wrapping around the edge
+        return ((r << 1) & full_row) | (r >> (cols - 1))
 
-    def draw_grid(grid_data, alpha=1.0):
-        image = Image.new("1", (width, height))
-        draw = ImageDraw.Draw(image)
+    def east(r):
+        return (r >> 1) | ((r & 1) << (cols - 1))
+
+    # Wrapped row indices, so the step does no modulo arithmetic
+    prev_row = [(y - 1) % rows for y in range(rows)]
+    next_row = [(y + 1) % rows for y in range(rows)]
+
+    def step(g):
+        # Each row's shifted copies are used by three rows; make them once
+        w = [west(r) for r in g]
+        e = [east(r) for r in g]
+        new_grid = []
         for y in range(rows):
-            for x in range(cols):
-                if grid_data[y][x]:
-                    if random.random() < alpha:
-                        x0, y0 = x * cell_size, y * cell_size
-                        draw.rectangle([x0, y0, x0 + cell_size - 1, y0 + cell_size - 1], fill=255)
-        display.image(image)
-        display.show()
+            u, d = prev_row[y], next_row[y]
+            mid = g[y]
+            # Bit-sliced neighbour count: ones/twos, fours latches at 4+
+            ones = twos = fours = 0
+            for n in (w[u], g[u], e[u], w[y], e[y], w[d], g[d], e[d]):
+                carry = ones & n
+                ones ^= n
+                fours |= twos & carry
+                twos ^= carry
+            # Alive next on exactly 3 neighbours, or 2 if already alive
+            new_grid.append(twos & ~fours & (ones | mid))
+        return new_grid
+
+    # Bit x of a row is column x ("1;R" raw mode); one resize scales cells up
+    row_bytes = (cols + 7) // 8
+
+    def draw_grid(grid_data, alpha=1.0):
+        data = b"".join(row.to_bytes(row_bytes, "little") for row in grid_data)
+        cells = Image.frombytes("1", (cols, rows), data, "raw", "1;R")
+        if alpha < 1.0:
+            # Fade: keep each live cell with probability alpha
+            noise = Image.frombytes("L", (cols, rows), random.randbytes(cols * rows))
+            keep = noise.point([255 if v < alpha * 256 else 0 for v in range(256)], "1")
+            cells = ImageChops.logical_and(cells, keep)
+        blit(cells.resize((width, height), Image.NEAREST))
 
     try:
         while True:
@@ -584,17 +991,7 @@ def screen_gameoflife():
                     time.sleep(0.03)
                 regenerate_event.clear()
 
-            new_grid = [[0 for _ in range(cols)] for _ in range(rows)]
-            for y in range(rows):
-                if stop_event.is_set() or btn_back.is_pressed:
-                    return
-                for x in range(cols):
-                    n = count_neighbors(x, y)
-                    if grid[y][x]:
-                        new_grid[y][x] = 1 if n in (2, 3) else 0
-                    else:
-                        new_grid[y][x] = 1 if n == 3 else 0
-            grid = new_grid
+            grid = step(grid)
             draw_grid(grid)
             delay = random.uniform(0.08, 0.14)
             for _ in range(int(delay / 0.01)):
@@ -609,13 +1006,19 @@ def screen_animation():
     x, y = 10, 20
     dx, dy = 2, 1
     frame_delay = 0.03
+    # Sprite drawn once; each frame erases its old square and pastes the new
+    sprite = Image.new("1", (sprite_size + 1, sprite_size + 1))
+    sprite_draw = ImageDraw.Draw(sprite)
+    sprite_draw.rectangle([0, 0, sprite_size, sprite_size], fill=255)
+    sprite_draw.rectangle([1, 1, sprite_size, sprite_size], outline=0)
+    image = Image.new("1", (WIDTH, HEIGHT))
+    prev = None
     while not stop_event.is_set():
-        image = Image.new("1", (WIDTH, HEIGHT))
-        draw = ImageDraw.Draw(image)
-        draw.rectangle([x, y, x + sprite_size, y + sprite_size], fill=255)
-        draw.rectangle([x+1, y+1, x+sprite_size, y+sprite_size], outline=0)
-        display.image(image)
-        display.show()
+        if prev:
+            image.paste(0, prev + (prev[0] + sprite_size + 1, prev[1] + sprite_size + 1))
+        image.paste(sprite, (x, y))
+        prev = (x, y)
+        blit(image)
         x += dx
         y += dy
         if x <= 0 or x + sprite_size >= WIDTH:  dx = -dx
@@ -626,6 +1029,8 @@ def screen_animation():
             time.sleep(frame_delay)
 
 def screen_clock():
+    image = Image.new("1", (WIDTH, HEIGHT))
+    draw = ImageDraw.Draw(image)
     while not stop_event.is_set():
         now = datetime.now()
         sep = ":" if now.second % 2 == 0 else " "
@@ -635,24 +1040,36 @@ def screen_clock():
         ampm = now.strftime("%p")
         time_str = f"{hour}{sep}{minute}{sep}{second} {ampm}"
         date_str = now.strftime("%b %d, %Y")
-        image = Image.new("1", (WIDTH, HEIGHT))
-        draw = ImageDraw.Draw(image)
+        draw.rectangle((0, 0, WIDTH, HEIGHT), fill=0)
         date_w, date_h = draw.textsize(date_str, font=font)
         time_w, time_h = draw.textsize(time_str, font=font)
         block_height = date_h + 4 + time_h
         top_y = (HEIGHT - block_height) // 2
         draw.text(((WIDTH - date_w) // 2, top_y), date_str, font=font, fill=255)
         draw.text(((WIDTH - time_w) // 2, top_y + date_h + 4), time_str, font=font, fill=255)
-        display.image(image)
-        display.show()
+        blit(image)
         for _ in range(10):
             if stop_event.is_set():
                 return
             time.sleep(0.1)
 
+def uptime_pretty():
+    # Format /proc/uptime like "up 3d 4h 12m" (short enough for one line)
+    with open("/proc/uptime") as f:
+        secs = int(float(f.read().split()[0]))
+    days, secs = divmod(secs, 86400)
+    hours, secs = divmod(secs, 3600)
+    parts = []
+    if days:
+        parts.append(f"{days}d")
+    if hours:
+        parts.append(f"{hours}h")
+    parts.append(f"{secs // 60}m")
+    return "up " + " ".join(parts)
+
 def screen_uptime():
     while not stop_event.is_set():
-        show_text(["System Uptime:", subprocess.getoutput("uptime -p")])
+        show_text(["System Uptime:", uptime_pretty()])
         for _ in range(100):
             if stop_event.is_set():
                 return
@@ -675,38 +1092,57 @@ def screen_loadavg():
             draw.text((2, 0), header, font=font, fill=255)
             max_load = max(1.0, max(history))
             scale = 40 / max_load
-            for x, val in enumerate(history):
-                h = int(val * scale)
-                y_top = HEIGHT - 1 - h
-                draw.line((x, y_top, x, HEIGHT - 1), fill=255)
+            heights = [int(val * scale) + 1 for val in history]
+            image.paste(255, (0, HEIGHT - 41), bar_graph_mask(heights, 41))
         else:
             draw.text((2, 0), "1m Load Avg ...", font=font, fill=255)
-        display.image(image)
-        display.show()
+        blit(image)
         for _ in range(int(sample_interval * 10)):
             if stop_event.is_set():
                 return
             time.sleep(0.1)
 
+# Partition usage barely moves, so the scan is shared and reused for a while
+DISK_CACHE_TTL = 60.0
+_disk_cache = {"t": float("-inf"), "data": []}
+
+def get_disk_usage():
+    # Return [(device, mount, percent)] for real drives, cached for DISK_CACHE_TTL
+    if time.monotonic() - _disk_cache["t"] < DISK_CACHE_TTL:
+        return _disk_cache["data"]
+    partitions = []
+    seen_devices = set()
+    for p in psutil.disk_partitions(all=False):
+        if ("loop" in p.device
+            or not os.path.exists(p.mountpoint)
+            or p.mountpoint.startswith("/boot/firmware")
+            or p.mountpoint == "/boot"):
+            continue
+        dev = p.device
+        if dev in seen_devices:
+            continue
+        seen_devices.add(dev)
+        try:
+            usage = psutil.disk_usage(p.mountpoint)
+            partitions.append((dev, p.mountpoint, usage.percent))
+        except PermissionError:
+            continue
+    _disk_cache["data"] = partitions
+    _disk_cache["t"] = time.monotonic()
+    return partitions
+
 def screen_diskspace():
+    shown = None
     while not stop_event.is_set():
-        partitions = []
-        seen_devices = set()
-        for p in psutil.disk_partitions(all=False):
-            if ("loop" in p.device
-                or not os.path.exists(p.mountpoint)
-                or p.mountpoint.startswith("/boot/firmware")
-                or p.mountpoint == "/boot"):
-                continue
-            dev = p.device
-            if dev in seen_devices:
-                continue
-            seen_devices.add(dev)
-            try:
-                usage = psutil.disk_usage(p.mountpoint)
-                partitions.append((dev, p.mountpoint, usage.percent))
-            except PermissionError:
-                continue
+        partitions = get_disk_usage()
+        if partitions is shown:
+            # Same scan as last time: the screen is already up to date
+            for _ in range(100):
+                if stop_event.is_set():
+                    return
+                time.sleep(0.1)
+            continue
+        shown = partitions
         image = Image.new("1", (WIDTH, HEIGHT))
         draw = ImageDraw.Draw(image)
         y = 0
@@ -733,61 +1169,100 @@ def screen_diskspace():
                 break
         if not partitions:
             draw.text((10, 28), "No drives found", font=font, fill=255)
-        display.image(image)
-        display.show()
+        blit(image)
         for _ in range(100):
             if stop_event.is_set():
                 return
             time.sleep(0.1)
 
+# SMART is polled in the background and never from a drive in standby or sleep
+SMART_DEVICE = "/dev/sda"
+SMART_POLL_INTERVAL = 300  # seconds
+SMART_HEALTH_PREFIX = "SMART overall-health self-assessment test result"
+SMART_SKIP_PREFIX = "Device is in "  # --nocheck skipped it: "Device is in SLEEP mode, exit(2)"
+SMART_ATTRS = {
+    "Temperature_Celsius": "temp",
+    "Temperature_Internal": "temp",
+    "Reallocated_Sector_Ct": "reallocated",
+    "Power_On_Hours": "hours",
+}
+smart_lines = ["SMART Status: ...", "Reading drive..."]
+smart_thread = None
+
+def read_smart(device):
+    # Return the SMART screen lines for device, or None if it is asleep
+    try:
+        result = subprocess.run(
+            ["sudo", "smartctl", "-A", "-H", "-i", "--nocheck=standby", device],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    except FileNotFoundError:
+        return ["smartctl not found"]
+    output = result.stdout.decode(errors="replace")
+    if any(line.startswith(SMART_SKIP_PREFIX) for line in output.splitlines()):
+        return None
+    # Exit bits 0/1 mean bad arguments or an unreadable device
+    if result.returncode & 0x3:
+        return ["SMART Read Error", f"smartctl exit {result.returncode}"]
+    health = "UNKNOWN"
+    values = {"temp": "?", "reallocated": "?", "hours": "?"}
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) > 1 and fields[1] in SMART_ATTRS:
+            values[SMART_ATTRS[fields[1]]] = fields[-1]
+        elif line.startswith(SMART_HEALTH_PREFIX):
+            health = "PASSED" if "PASSED" in line else ("FAILED" if "FAILED" in line else health)
+    lines = [f"SMART Status: {health}"]
+    if health == "PASSED":
+        lines += [f"Temp: {values['temp']} C", f"Hours: {values['hours']}",
+                  f"Realloc: {values['reallocated']}"]
+    else:
+        lines += ["Drive may be failing!"]
+    return lines
+
+def smart_poller():
+    global smart_lines
+    while True:
+        lines = read_smart(SMART_DEVICE)
+        if lines is not None:
+            smart_lines = lines
+        elif smart_lines[0] == "SMART Status: ...":
+            # Asleep before the first good read; keep old values otherwise
+            smart_lines = ["SMART Status: ...", "Drive in standby"]
+        time.sleep(SMART_POLL_INTERVAL)
+
 def screen_smart():
-    device = "/dev/sda"
+    global smart_thread
+    if smart_thread is None:
+        smart_thread = threading.Thread(target=smart_poller, daemon=True)
+        smart_thread.start()
+    shown = None
     while not stop_event.is_set():
-        try:
-            output = subprocess.check_output(["sudo", "smartctl", "-a", device], stderr=subprocess.STDOUT).decode()
-            health = "UNKNOWN"
-            temp = "?"
-            reallocated = "?"
-            hours = "?"
-            for line in output.splitlines():
-                if "SMART overall-health self-assessment test result" in line:
-                    health = "PASSED" if "PASSED" in line else ("FAILED" if "FAILED" in line else health)
-                elif "Temperature_Celsius" in line or "Temperature_Internal" in line:
-                    parts = line.split()
-                    temp = parts[-1]
-                elif "Reallocated_Sector_Ct" in line:
-                    parts = line.split()
-                    reallocated = parts[-1]
-                elif "Power_On_Hours" in line:
-                    parts = line.split()
-                    hours = parts[-1]
-            lines = [f"SMART Status: {health}"]
-            if health == "PASSED":
-                lines += [f"Temp: {temp} C", f"Hours: {hours}", f"Realloc: {reallocated}"]
-            else:
-                lines += ["Drive may be failing!"]
+        lines = smart_lines
+        if lines is not shown:
             show_text(lines, center=False)
-        except subprocess.CalledProcessError as e:
-            show_text(["SMART Read Error", str(e)], center=False)
-        except FileNotFoundError:
-            show_text(["smartctl not found"], center=False)
-        for _ in range(300):
-            if stop_event.is_set():
-                return
-            time.sleep(0.1)
+            shown = lines
+        time.sleep(0.1)
 
 # -------------------------------
 # Thread orchestration
 # -------------------------------
+def _run_submenu(target):
+    try:
+        target()
+    finally:
+        _submenu_active.clear()
+        wake.set()  # the main loop sleeps for as long as a submenu runs
+
 def start_submenu(target):
     global submenu_thread
     stop_event.clear()
-    submenu_thread = threading.Thread(target=target, daemon=True)
+    _submenu_active.set()
+    submenu_thread = threading.Thread(target=_run_submenu, args=(target,), daemon=True)
     submenu_thread.start()
 
 def stop_submenu():
     stop_event.set()
-    if submenu_thread and submenu_thread.is_alive():
+    if _submenu_active.is_set():
         submenu_thread.join(timeout=1)
     show_menu()
 
@@ -817,35 +1292,33 @@ def perform_action(index):
 # Wake to menu from background
 # -------------------------------
 def wake_to_menu():
-    global current_view
+    global current_view, _bg_image
     if current_view == "background":
-        # Build frames for fade: from current background to menu
-        bg_img = draw_system_screen() if not show_weather else draw_weather_screen()
+        # Fade from exactly what is on the panel to the menu
+        bg_img = _bg_image if _bg_image is not None else background_frame()
+        _bg_image = None
         menu_img = render_menu_image_only()
         fade_to_menu(bg_img, menu_img, duration=FADE_DURATION, steps=10)
         current_view = "menu"
         show_menu()
 
+_menu_snapshot = (None, None)  # (layout, image) from render_menu_image_only
+
 def render_menu_image_only():
     # helper to generate menu image without showing it immediately
-    global menu_offset
+    with _menu_lock:
+        return _render_menu_image_only()
+
+def _render_menu_image_only():
+    global _menu_snapshot
+    _scroll_to_selection()
+    layout = (menu_offset, selected_index)
+    if _menu_snapshot[0] == layout:
+        # Same menu as last time: reuse it so slides hit the slide cache
+        return _menu_snapshot[1]
     image = Image.new("1", (WIDTH, HEIGHT))
-    draw = ImageDraw.Draw(image)
-    if selected_index < menu_offset:
-        menu_offset = selected_index
-    elif selected_index >= menu_offset + VISIBLE_LINES:
-        menu_offset = selected_index - VISIBLE_LINES + 1
-    visible_items = menu_items[menu_offset:menu_offset + VISIBLE_LINES]
-    total_height = len(visible_items) * 8
-    top_margin = max(0, (HEIGHT - total_height) // 2)
-    for i, item in enumerate(visible_items):
-        y = top_margin + i * 8
-        absolute_index = menu_offset + i
-        if absolute_index == selected_index:
-            ImageDraw.Draw(image).rectangle([0, y, WIDTH - 1, y + 8], fill=255)
-            ImageDraw.Draw(image).text((2, y), item, font=font, fill=0)
-        else:
-            ImageDraw.Draw(image).text((2, y), item, font=font, fill=255)
+    _paint_menu(image)
+    _menu_snapshot = (layout, image)
     return image
 
 # -------------------------------
@@ -856,7 +1329,7 @@ def confirm_pressed():
     if current_view == "background":
         wake_to_menu()
         return
-    if submenu_thread and submenu_thread.is_alive():
+    if _submenu_active.is_set():
         stop_event.set()
     else:
         perform_action(selected_index)
@@ -866,7 +1339,7 @@ def back_pressed():
     if current_view == "background":
         wake_to_menu()
         return
-    if submenu_thread and submenu_thread.is_alive():
+    if _submenu_active.is_set():
         stop_event.set()
     else:
         show_menu()
@@ -874,84 +1347,114 @@ def back_pressed():
 def knob_pressed():
     confirm_pressed()
 
+# Encoder ticks flag the menu; the main loop repaints once per wakeup
+_menu_dirty = False
+
 def on_rotate():
-    global selected_index
-    mark_activity()
+    global selected_index, _menu_dirty
     if current_view == "background":
+        mark_activity()
         wake_to_menu()
         return
-    if submenu_thread and submenu_thread.is_alive():
-        return
-    selected_index = encoder.steps % len(menu_items)
-    show_menu()
+    if not _submenu_active.is_set():
+        selected_index = encoder.steps % len(menu_items)
+        _menu_dirty = True
+    # Wake last, once the new selection is in place
+    mark_activity()
+
+def on_confirm():
+    (stop_submenu if _submenu_active.is_set() else confirm_pressed)()
+
+def on_back():
+    (stop_submenu if _submenu_active.is_set() else back_pressed)()
 
 # Wire events
 encoder.when_rotated = on_rotate
-btn_confirm.when_pressed = lambda: (
-    confirm_pressed() if not (submenu_thread and submenu_thread.is_alive())
-    else stop_submenu()
-)
-btn_back.when_pressed = lambda: (
-    stop_submenu() if (submenu_thread and submenu_thread.is_alive())
-    else back_pressed()
-)
+btn_confirm.when_pressed = on_confirm
+btn_back.when_pressed = on_back
 btn_knob.when_pressed = knob_pressed
 
 # -------------------------------
 # Main loop with idle-to-background logic
 # -------------------------------
 def show_background_loop_frame():
-    global show_weather, background_cycle_start
-    if background_cycle_start == 0:
-        background_cycle_start = now_ts()
-    elapsed = now_ts() - background_cycle_start
-    if show_weather and elapsed > 15:
-        # slide back to system
-        w = draw_weather_screen()
-        s = draw_system_screen()
-        slide_transition(w, s)
-        show_weather = False
-        background_cycle_start = now_ts()
-    elif (not show_weather) and elapsed > 15:
-        # slide to weather
-        s = draw_system_screen()
-        w = draw_weather_screen()
-        slide_transition(s, w)
-        show_weather = True
-        background_cycle_start = now_ts()
+    # Refresh the current background screen, or slide to the other one when due
+    global show_weather, background_swap_at, _bg_image
+    if time.monotonic() >= background_swap_at:
+        # Slide away from the frame already on the panel
+        current = _bg_image if _bg_image is not None else background_frame()
+        show_weather = not show_weather
+        frame = background_frame()
+        slide_transition(current, frame)
+        background_swap_at = time.monotonic() + BACKGROUND_SWAP_INTERVAL
     else:
-        # draw current background screen
-        frame = draw_weather_screen() if show_weather else draw_system_screen()
-        display.image(frame)
-        display.show()
+        frame = background_frame()
+        if frame is _bg_image:
+            return
+        blit(frame)
+    _bg_image = frame
+
+def next_wakeup():
+    # Monotonic time of the main loop's next timed work, or None to wait for an event
+    now = time.monotonic()
+    if _submenu_active.is_set():
+        return None
+    if current_view == "menu":
+        return idle_deadline
+    return min(background_swap_at, now + BACKGROUND_TICK)
+
+def warm_caches():
+    # Render the idle-slide frames once so the first slide doesn't stall
+    # Also warms the glyph caches and PIL's lazily loaded codecs
+    system_frame()
+    weather_frame()
+    render_menu_image_only()
 
 def main():
-    global current_view, background_cycle_start, show_weather, last_user_activity
+    global current_view, background_swap_at, show_weather, idle_deadline, _bg_image, _menu_dirty
     # start on menu
+    threading.Thread(target=sys_sampler, daemon=True).start()
+    threading.Thread(target=weather_poller, daemon=True).start()
+    threading.Thread(target=warm_caches, daemon=True).start()
     show_menu()
-    last_user_activity = now_ts()
+    idle_deadline = time.monotonic() + IDLE_TIMEOUT
     display_idle_slid = False
 
+    # Bind what every iteration touches to locals
+    _wait = wake.wait
+    _clear = wake.clear
+    _next_wakeup = next_wakeup
+    _monotonic = time.monotonic
+    _max = max
+    _show_background = show_background_loop_frame
+    _submenu_running = _submenu_active.is_set
+
     while True:
-        time.sleep(0.05)
+        deadline = _next_wakeup()
+        _wait(None if deadline is None else _max(0.0, deadline - _monotonic()))
+        _clear()
 
         # If in submenu, do nothing with idle timer
-        if submenu_thread and submenu_thread.is_alive():
+        if _submenu_running():
             continue
 
         if current_view == "menu":
+            if _menu_dirty:
+                _menu_dirty = False
+                move_menu_selection()
             # check for idle timeout only while on the menu
-            if now_ts() - last_user_activity >= IDLE_TIMEOUT:
+            if _monotonic() >= idle_deadline:
                 # build the slide from menu to background system screen
-                sys_img = draw_system_screen()
+                sys_img = system_frame()
                 menu_img = render_menu_image_only()
                 slide_transition(menu_img, sys_img, delay=0.01, step=8)
+                _bg_image = sys_img
                 current_view = "background"
                 show_weather = False
-                background_cycle_start = now_ts()
+                background_swap_at = _monotonic() + BACKGROUND_SWAP_INTERVAL
         else:
             # background visible: update dashboard, and keep checking for wake via handlers
-            show_background_loop_frame()
+            _show_background()
 
 # Run
 if __name__ == "__main__":